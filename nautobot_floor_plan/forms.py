@@ -4,7 +4,13 @@
 
 """Forms for nautobot_floor_plan."""
 
+import json
+import string
+from typing import NamedTuple
+
 from django import forms
+from django.db import transaction
+from django.db.models import Exists, OuterRef
 from nautobot.apps.config import get_app_settings_or_config
 from nautobot.apps.forms import (
     DynamicModelChoiceField,
@@ -19,11 +25,88 @@ from nautobot.apps.forms import (
 from nautobot.dcim.models import Location, Rack, RackGroup
 
 from nautobot_floor_plan import choices, models
-from nautobot_floor_plan.utils import general
 from nautobot_floor_plan.utils.custom_validators import RangeValidator
+from nautobot_floor_plan.utils.general import (
+    axis_clean_label_conversion,
+    axis_init_label_conversion,
+    grid_letter_to_number,
+    grid_number_to_letter,
+)
 from nautobot_floor_plan.utils.label_converters import LabelToPositionConverter, PositionToLabelConverter
 
 
+class AxisFields(NamedTuple):
+    """Names of the per-axis fields shared by the FloorPlan and FloorPlanTile forms."""
+
+    axis_labels: str
+    size: str
+    origin_seed: str
+    axis_step: str
+    custom_ranges: str
+    origin: str
+    has_custom_labels: str
+    size_limit: str
+    letters: str
+
+
+def _is_integer_label(value):
+    """Return True if value is a positive or negative integer string, e.g. "7" or "-12"."""
+    digits = value[1:] if value.startswith("-") else value
+    # Stripping the digits leaves an empty string only when nothing else is present
+    return bool(digits) and not digits.strip(string.digits)
+
+
+# Axis label choices with a leading blank entry, shared by the optional axis label fields
+BLANK_AXIS_LABELS_CHOICES = tuple(add_blank_choice(choices.AxisLabelsChoices))
+
+# Base querysets shared by the fields of several forms; each form instance works on its own copy
+LOCATION_QUERYSET = Location.objects.all()
+FLOOR_PLAN_QUERYSET = models.FloorPlan.objects.all()
+
+# Axis label choices compared against on every clean, bound once at import
+LETTERS_AXIS_LABELS = choices.AxisLabelsChoices.LETTERS
+NUMBERS_LABEL_TYPE = choices.CustomAxisLabelsChoices.NUMBERS
+NUMERIC_LABEL_TYPES = (choices.CustomAxisLabelsChoices.HEX, choices.CustomAxisLabelsChoices.BINARY)
+
+# FloorPlan columns read by FloorPlanTileForm when converting origins to and from labels
+FLOOR_PLAN_LOOKUP_FIELDS = (
+    "x_size",
+    "y_size",
+    "x_axis_labels",
+    "y_axis_labels",
+    "x_origin_seed",
+    "y_origin_seed",
+    "x_axis_step",
+    "y_axis_step",
+    "is_tile_movable",
+)
+
+AXIS_FIELDS = {
+    "X": AxisFields(
+        "x_axis_labels",
+        "x_size",
+        "x_origin_seed",
+        "x_axis_step",
+        "x_custom_ranges",
+        "x_origin",
+        "has_x_custom_labels",
+        "x_size_limit",
+        "x_letters",
+    ),
+    "Y": AxisFields(
+        "y_axis_labels",
+        "y_size",
+        "y_origin_seed",
+        "y_axis_step",
+        "y_custom_ranges",
+        "y_origin",
+        "has_y_custom_labels",
+        "y_size_limit",
+        "y_letters",
+    ),
+}
+
+
 class FloorPlanForm(NautobotModelForm):
     """FloorPlan creation/edit form with support for custom axis label ranges."""
 
@@ -33,7 +116,7 @@ class FloorPlanForm(NautobotModelForm):
         "Examples: <a href='#' data-toggle='modal' data-target='#exampleModal'>Click here for examples</a>."
     )
 
-    location = DynamicModelChoiceField(queryset=Location.objects.all())
+    location = DynamicModelChoiceField(queryset=LOCATION_QUERYSET)
 
     # X Axis Fields
     x_origin_seed = forms.CharField(
@@ -105,76 +188,79 @@ class FloorPlanForm(NautobotModelForm):
     def __init__(self, *args, **kwargs):
         """Overwrite the constructor to set initial values and handle custom ranges."""
         super().__init__(*args, **kwargs)
+        # Custom ranges that already passed validation, keyed by axis, floor plan size and serialized ranges
+        self._validated_ranges = {}
+        # App settings read by this form, looked up at most once per form instance
+        self._app_settings = {}
 
         # Set initial values for select widget
         if not self.instance.created:
-            self.initial["x_axis_labels"] = get_app_settings_or_config("nautobot_floor_plan", "default_x_axis_labels")
-            self.initial["y_axis_labels"] = get_app_settings_or_config("nautobot_floor_plan", "default_y_axis_labels")
-            self.x_letters = self.initial["x_axis_labels"] == choices.AxisLabelsChoices.LETTERS
-            self.y_letters = self.initial["y_axis_labels"] == choices.AxisLabelsChoices.LETTERS
+            self.initial["x_axis_labels"] = self._get_app_setting("default_x_axis_labels")
+            self.initial["y_axis_labels"] = self._get_app_setting("default_y_axis_labels")
+            self.x_letters = self.initial["x_axis_labels"] == LETTERS_AXIS_LABELS
+            self.y_letters = self.initial["y_axis_labels"] == LETTERS_AXIS_LABELS
             self.initial["x_origin_seed"] = "A" if self.x_letters else "1"
             self.initial["y_origin_seed"] = "A" if self.y_letters else "1"
         else:
-            self.x_letters = self.instance.x_axis_labels == choices.AxisLabelsChoices.LETTERS
-            self.y_letters = self.instance.y_axis_labels == choices.AxisLabelsChoices.LETTERS
-
-        if self.x_letters and str(self.initial["y_origin_seed"]).isdigit():
-            self.initial["x_origin_seed"] = general.grid_number_to_letter(self.instance.x_origin_seed)
-        if self.y_letters and str(self.initial["y_origin_seed"]).isdigit():
-            self.initial["y_origin_seed"] = general.grid_number_to_letter(self.instance.y_origin_seed)
-
-        # Load existing custom ranges
+            self.x_letters = self.instance.x_axis_labels == LETTERS_AXIS_LABELS
+            self.y_letters = self.instance.y_axis_labels == LETTERS_AXIS_LABELS
+
+            # Stored seeds are numbers; show them as letters on letter-labelled axes. isascii() keeps non-ASCII
+            # digits, which isdigit() alone accepts, from being treated as a stored seed.
+            x_seed = str(self.initial["x_origin_seed"])
+            if self.x_letters and x_seed.isascii() and x_seed.isdigit():
+                self.initial["x_origin_seed"] = grid_number_to_letter(self.instance.x_origin_seed)
+            y_seed = str(self.initial["y_origin_seed"])
+            if self.y_letters and y_seed.isascii() and y_seed.isdigit():
+                self.initial["y_origin_seed"] = grid_number_to_letter(self.instance.y_origin_seed)
+
+        # Load existing custom ranges for both axes with a single query, skipped entirely when the edit view has
+        # already annotated the instance as having none
         if self.instance.pk:
-            x_ranges = list(
-                self.instance.custom_labels.filter(axis="X")
-                .values("start_label", "end_label", "step", "increment_letter", "label_type", "order")
-                .order_by("order")
-            )
-            y_ranges = list(
-                self.instance.custom_labels.filter(axis="Y")
-                .values("start_label", "end_label", "step", "increment_letter", "label_type", "order")
-                .order_by("order")
-            )
+            ranges = {"X": [], "Y": []}
+            if getattr(self.instance, "has_custom_labels", True):
+                rows = self.instance.custom_labels.order_by("axis", "order").values_list(
+                    "axis", "start_label", "end_label", "step", "increment_letter", "label_type"
+                )
+                for axis, start, end, step, increment_letter, label_type in rows:
+                    ranges[axis].append(
+                        {
+                            "start": start,
+                            "end": end,
+                            "step": step,
+                            "increment_letter": increment_letter,
+                            "label_type": label_type,
+                        }
+                    )
 
             # Set the properties based on whether custom ranges exist
-            self.has_x_custom_labels = bool(x_ranges)
-            self.has_y_custom_labels = bool(y_ranges)
-
-            if x_ranges:
-                self.initial["x_custom_ranges"] = [
-                    {
-                        "start": r["start_label"],
-                        "end": r["end_label"],
-                        "step": r["step"],
-                        "increment_letter": r["increment_letter"],
-                        "label_type": r["label_type"],
-                    }
-                    for r in x_ranges
-                ]
-            if y_ranges:
-                self.initial["y_custom_ranges"] = [
-                    {
-                        "start": r["start_label"],
-                        "end": r["end_label"],
-                        "step": r["step"],
-                        "increment_letter": r["increment_letter"],
-                        "label_type": r["label_type"],
-                    }
-                    for r in y_ranges
-                ]
+            self.has_x_custom_labels = bool(ranges["X"])
+            self.has_y_custom_labels = bool(ranges["Y"])
+
+            if ranges["X"]:
+                self.initial["x_custom_ranges"] = ranges["X"]
+            if ranges["Y"]:
+                self.initial["y_custom_ranges"] = ranges["Y"]
+
+    def _get_app_setting(self, name):
+        """Return an app setting, caching it for the lifetime of this form.
+
+        The cache is deliberately per instance: the settings can change at runtime (Constance), so they must not be
+        cached at module level.
+        """
+        if name not in self._app_settings:
+            self._app_settings[name] = get_app_settings_or_config("nautobot_floor_plan", name)
+        return self._app_settings[name]
 
     def _clean_origin_seed(self, field_name, axis):
         """Clean method for origin seed fields."""
-        value = self.cleaned_data.get(field_name)
+        cleaned_data = self.cleaned_data
+        value = cleaned_data.get(field_name)
         if not value:
             return value
 
         # Determine if using letters based on axis labels
-        using_letters = (
-            self.cleaned_data.get("x_axis_labels") == choices.AxisLabelsChoices.LETTERS
-            if axis == "X"
-            else self.cleaned_data.get("y_axis_labels") == choices.AxisLabelsChoices.LETTERS
-        )
+        using_letters = cleaned_data.get(AXIS_FIELDS[axis].axis_labels) == LETTERS_AXIS_LABELS
 
         # Validate format based on axis label type
         if using_letters:
@@ -183,11 +269,10 @@ class FloorPlanForm(NautobotModelForm):
             if not value.isupper():
                 raise forms.ValidationError(f"{axis} origin seed should be uppercase letters.")
             # Convert letter to corresponding number
-            return general.grid_letter_to_number(value)
-        try:
-            return int(value)
-        except ValueError as e:
-            raise forms.ValidationError(f"{axis} origin seed should be a number when using numeric labels.") from e
+            return grid_letter_to_number(value)
+        if not _is_integer_label(value):
+            raise forms.ValidationError(f"{axis} origin seed should be a number when using numeric labels.")
+        return int(value)
 
     def clean_x_origin_seed(self):
         """Validate the X origin seed."""
@@ -199,146 +284,158 @@ class FloorPlanForm(NautobotModelForm):
 
     def clean(self):
         """Custom clean method to validate floor plan dimensions."""
-        cleaned_data = super().clean()
-        x_size = self.cleaned_data.get("x_size")
-        y_size = self.cleaned_data.get("y_size")
-
-        # Get the configured limits
-        x_size_limit = get_app_settings_or_config("nautobot_floor_plan", "x_size_limit")
-        y_size_limit = get_app_settings_or_config("nautobot_floor_plan", "y_size_limit")
-
-        # Validate X size only if a limit is set
-        if x_size_limit is not None and x_size is not None and x_size > x_size_limit:
-            self.add_error("x_size", f"X size cannot exceed {x_size_limit} as defined in nautobot_config.py.")
-
-        # Validate Y size only if a limit is set
-        if y_size_limit is not None and y_size is not None and y_size > y_size_limit:
-            self.add_error("y_size", f"Y size cannot exceed {y_size_limit} as defined in nautobot_config.py.")
+        # NautobotModelForm.clean() doesn't return the cleaned data, so read it once from the form.
+        # Fields that already failed validation are absent from cleaned_data, so they are not checked twice.
+        super().clean()
+        cleaned_data = self.cleaned_data
+
+        # Validate each axis size only if a limit is configured for it
+        for axis, axis_fields in AXIS_FIELDS.items():
+            size = cleaned_data.get(axis_fields.size)
+            size_limit = self._get_app_setting(axis_fields.size_limit)
+            if size_limit is not None and size is not None and size > size_limit:
+                self.add_error(
+                    axis_fields.size, f"{axis} size cannot exceed {size_limit} as defined in nautobot_config.py."
+                )
 
         return cleaned_data
 
     def save(self, commit=True):
         """Save the FloorPlan instance along with custom ranges."""
         instance = super().save(commit=False)
+        # save() normalizes the ranges in place, so they must be validated again if the form is cleaned afterwards
+        self._validated_ranges.clear()
         x_ranges = self.cleaned_data.get("x_custom_ranges", [])
         y_ranges = self.cleaned_data.get("y_custom_ranges", [])
 
         # Set increment_letter defaults
-        for label_range in x_ranges:
-            if label_range.get("increment_letter", True) and label_range["label_type"] == "numbers":
-                label_range["increment_letter"] = False
-
-        for label_range in y_ranges:
-            if label_range.get("increment_letter", True) and label_range["label_type"] == "numbers":
+        for label_range in (*x_ranges, *y_ranges):
+            if label_range.get("increment_letter", True) and label_range["label_type"] == NUMBERS_LABEL_TYPE:
                 label_range["increment_letter"] = False
 
         if commit:
-            instance.save()
-            self.save_m2m()
-
-            # Clear existing custom ranges
-            models.FloorPlanCustomAxisLabel.objects.filter(floor_plan=instance).delete()
-
-            # Save X axis custom ranges
-            if x_ranges:
-                self.create_custom_axis_labels(x_ranges, instance, axis="X")
-            # Save Y axis custom ranges
-            if y_ranges:
-                self.create_custom_axis_labels(y_ranges, instance, axis="Y")
+            # Replace the custom ranges atomically so concurrent edits never observe a floor plan without its labels.
+            # The UPDATE issued by instance.save() holds the FloorPlan row lock until the transaction completes.
+            with transaction.atomic():
+                instance.save()
+                self.save_m2m()
+
+                # Clear existing custom ranges
+                models.FloorPlanCustomAxisLabel.objects.filter(floor_plan=instance).delete()
+
+                # Save X and Y axis custom ranges with a single INSERT
+                labels = [
+                    *self.build_custom_axis_labels(x_ranges, instance, axis="X"),
+                    *self.build_custom_axis_labels(y_ranges, instance, axis="Y"),
+                ]
+                if labels:
+                    models.FloorPlanCustomAxisLabel.objects.bulk_create(labels)
 
         return instance
 
+    def build_custom_axis_labels(self, ranges, instance, axis):
+        """Helper function to build unsaved custom axis labels."""
+        return [
+            models.FloorPlanCustomAxisLabel(
+                floor_plan=instance,
+                axis=axis,
+                start_label=custom_range["start"],
+                end_label=custom_range["end"],
+                step=custom_range.get("step", 1),
+                label_type=custom_range["label_type"],
+                increment_letter=custom_range.get("increment_letter", True),
+                order=idx,  # Assign order based on index
+            )
+            for idx, custom_range in enumerate(ranges)
+        ]
+
     def create_custom_axis_labels(self, ranges, instance, axis):
         """Helper function to create custom axis labels."""
-        labels = []
-        for idx, custom_range in enumerate(ranges):
-            labels.append(
-                models.FloorPlanCustomAxisLabel(
-                    floor_plan=instance,
-                    axis=axis,
-                    start_label=custom_range["start"],
-                    end_label=custom_range["end"],
-                    step=custom_range.get("step", 1),
-                    label_type=custom_range["label_type"],
-                    increment_letter=custom_range.get("increment_letter", True),
-                    order=idx,  # Assign order based on index
-                )
-            )
-        models.FloorPlanCustomAxisLabel.objects.bulk_create(labels)
+        models.FloorPlanCustomAxisLabel.objects.bulk_create(self.build_custom_axis_labels(ranges, instance, axis))
 
-    def _validate_custom_ranges(self, field_name):
+    def _validate_custom_ranges(self, axis):
         """Validate custom label ranges."""
-        custom_ranges = self.cleaned_data.get(field_name, [])
+        axis_fields = AXIS_FIELDS[axis]
+        cleaned_data = self.cleaned_data
+        custom_ranges = cleaned_data.get(axis_fields.custom_ranges, [])
         if not custom_ranges:
             return []
 
-        is_x_axis = field_name == "x_custom_ranges"
-        max_size = self.cleaned_data.get("x_size" if is_x_axis else "y_size")
+        max_size = cleaned_data.get(axis_fields.size)
+        cache_key = (axis, max_size, json.dumps(custom_ranges, sort_keys=True))
+        if cache_key in self._validated_ranges:
+            return self._validated_ranges[cache_key]
+
         validator = RangeValidator(max_size)
 
-        # First validate each individual range
+        # Validate the shape of every range before running any of the (more expensive) semantic checks
         for label_range in custom_ranges:
             validator.validate_required_keys(label_range)
 
+        # Then validate each individual range
+        for label_range in custom_ranges:
             start = label_range["start"]
             end = label_range["end"]
             label_type = label_range["label_type"]
 
             validator.validate_label_type(label_type)
-            if label_type == choices.CustomAxisLabelsChoices.NUMBERS and label_range.get("increment_letter"):
-                validator.validate_increment_letter_for_numbers(label_range.get("increment_letter"))
-            if label_type in [choices.CustomAxisLabelsChoices.HEX, choices.CustomAxisLabelsChoices.BINARY]:
+            validator.validate_step(label_range)
+            if label_type == NUMBERS_LABEL_TYPE and label_range.get("increment_letter"):
+                validator.validate_increment_letter_for_numbers(label_range["increment_letter"])
+            if label_type in NUMERIC_LABEL_TYPES:
                 validator.validate_numeric_range(start, end, current_range=label_range)
             else:
                 validator.validate_custom_range(start, end, label_type, current_range=label_range)
             validator.validate_increment_letter(label_range, label_type)
 
-        # Then validate that ranges don't overlap
-        validator.validate_multiple_ranges(custom_ranges)
+        # Then validate that ranges don't overlap, unless they are the ranges already stored for this floor plan
+        if custom_ranges != self.initial.get(axis_fields.custom_ranges):
+            validator.validate_multiple_ranges(custom_ranges)
 
+        self._validated_ranges[cache_key] = custom_ranges
         return custom_ranges
 
     def clean_x_custom_ranges(self):
         """Validate the X axis custom ranges."""
-        return self._validate_custom_ranges("x_custom_ranges")
+        return self._validate_custom_ranges("X")
 
     def clean_y_custom_ranges(self):
         """Validate the Y axis custom ranges."""
-        return self._validate_custom_ranges("y_custom_ranges")
+        return self._validate_custom_ranges("Y")
 
 
 class FloorPlanBulkEditForm(TagsBulkEditFormMixin, NautobotBulkEditForm):  # pylint: disable=too-many-ancestors
     """FloorPlan bulk edit form."""
 
-    pk = forms.ModelMultipleChoiceField(queryset=models.FloorPlan.objects.all(), widget=forms.MultipleHiddenInput)
+    pk = forms.ModelMultipleChoiceField(queryset=FLOOR_PLAN_QUERYSET, widget=forms.MultipleHiddenInput)
     x_size = forms.IntegerField(min_value=1, required=False)
     y_size = forms.IntegerField(min_value=1, required=False)
     tile_width = forms.IntegerField(min_value=1, required=False)
     tile_depth = forms.IntegerField(min_value=1, required=False)
-    x_axis_labels = forms.ChoiceField(choices=add_blank_choice(choices.AxisLabelsChoices), required=False)
-    y_axis_labels = forms.ChoiceField(choices=add_blank_choice(choices.AxisLabelsChoices), required=False)
+    x_axis_labels = forms.ChoiceField(choices=BLANK_AXIS_LABELS_CHOICES, required=False)
+    y_axis_labels = forms.ChoiceField(choices=BLANK_AXIS_LABELS_CHOICES, required=False)
 
     class Meta:
         """Meta attributes."""
 
-        fields = ["pk", "x_size", "y_size", "tile_width", "tile_depth", "tags"]
+        fields = ("pk", "x_size", "y_size", "tile_width", "tile_depth", "tags")
 
 
 class FloorPlanFilterForm(NautobotFilterForm):
     """Filter form to filter searches."""
 
     model = models.FloorPlan
-    field_order = ["q", "location", "x_size", "y_size"]
+    field_order = ("q", "location", "x_size", "y_size")
 
     q = forms.CharField(required=False, label="Search")
-    location = DynamicModelMultipleChoiceField(queryset=Location.objects.all(), to_field_name="pk", required=False)
+    location = DynamicModelMultipleChoiceField(queryset=LOCATION_QUERYSET, to_field_name="pk", required=False)
     tag = TagFilterField(model)
 
 
 class FloorPlanTileForm(NautobotModelForm):
     """FloorPlanTile creation/edit form."""
 
-    floor_plan = DynamicModelChoiceField(queryset=models.FloorPlan.objects.all())
+    floor_plan = DynamicModelChoiceField(queryset=FLOOR_PLAN_QUERYSET)
     rack = DynamicModelChoiceField(
         queryset=Rack.objects.all(),
         required=False,
@@ -356,7 +453,7 @@ class FloorPlanTileForm(NautobotModelForm):
     x_origin = forms.CharField()
     y_origin = forms.CharField()
 
-    field_order = [
+    field_order = (
         "floor_plan",
         "x_origin",
         "y_origin",
@@ -366,20 +463,32 @@ class FloorPlanTileForm(NautobotModelForm):
         "rack",
         "rack_group",
         "rack_orientation",
-    ]
+    )
 
     class Meta:
         """Meta attributes."""
 
         model = models.FloorPlanTile
         fields = "__all__"
-        exclude = ["allocation_type", "on_group_tile"]  # pylint: disable=modelform-uses-exclude
+        exclude = ("allocation_type", "on_group_tile")  # pylint: disable=modelform-uses-exclude
+
+    def _get_floor_plan(self, fp_id):
+        """Fetch the selected FloorPlan with only the columns needed to convert tile origins."""
+        return self.fields["floor_plan"].queryset.select_related(None).only(*FLOOR_PLAN_LOOKUP_FIELDS).get(id=fp_id)
+
+    def _get_label_converter(self, fp_obj):
+        """Return the batch label converter for the given floor plan, loading its custom ranges on first use.
+
+        A converter passed to the form, or built while initializing it, is replaced if it belongs to another floor plan.
+        """
+        if self.label_converter is None or self.label_converter.fp_obj.pk != fp_obj.pk:
+            self.label_converter = LabelToPositionConverter.build_batch(fp_obj)
+        return self.label_converter
 
     def _convert_label_to_position(self, value, axis, fp_obj):
         """Wrapper for the LabelToPositionConverter."""
         try:
-            converter = LabelToPositionConverter(value, axis, fp_obj)
-            absolute_position, _ = converter.convert()
+            absolute_position, _ = self._get_label_converter(fp_obj).convert(value, axis)
             return absolute_position, None  # Return None for the error when successful
         except ValueError as e:
             return None, forms.ValidationError(str(e))
@@ -395,7 +504,7 @@ class FloorPlanTileForm(NautobotModelForm):
                 raise error
 
             # Validate against floor plan size
-            max_size = fp_obj.x_size if axis == "X" else fp_obj.y_size
+            max_size = getattr(fp_obj, AXIS_FIELDS[axis].size)
             if position > max_size:
                 raise forms.ValidationError(
                     f"Position {value} (absolute: {position}) exceeds floor plan {axis} size of {max_size}"
@@ -406,72 +515,87 @@ class FloorPlanTileForm(NautobotModelForm):
         except ValueError as e:
             raise forms.ValidationError(f"Invalid {axis}-axis value: {str(e)}")
 
+    def _clean_axis_origin(self, axis):
+        """Clean an origin field, converting custom labels when the floor plan defines them for the axis."""
+        axis_fields = AXIS_FIELDS[axis]
+        # The floor plan is missing from cleaned_data if it failed validation; _clean_origin() handles that case
+        if getattr(self.cleaned_data.get("floor_plan"), axis_fields.has_custom_labels, False):
+            return self._clean_custom_origin(axis_fields.origin, axis)
+        return self._clean_origin(axis_fields.origin, axis)
+
     def clean_x_origin(self):
         """Clean method for x_origin field."""
-        fp_obj = self.cleaned_data.get("floor_plan")
-        if fp_obj.custom_labels.filter(axis="X").exists():
-            return self._clean_custom_origin("x_origin", "X")
-        return self._clean_origin("x_origin", "X")
+        return self._clean_axis_origin("X")
 
     def clean_y_origin(self):
         """Clean method for y_origin field."""
-        fp_obj = self.cleaned_data.get("floor_plan")
-        if fp_obj.custom_labels.filter(axis="Y").exists():
-            return self._clean_custom_origin("y_origin", "Y")
-        return self._clean_origin("y_origin", "Y")
+        return self._clean_axis_origin("Y")
 
-    def __init__(self, *args, **kwargs):
-        """Initialize the form and handle custom label conversions."""
+    def __init__(self, *args, converter=None, **kwargs):
+        """Initialize the form and handle custom label conversions.
+
+        An optional `converter` from LabelToPositionConverter.build_batch() can be shared across the tile forms of one
+        floor plan so its custom ranges are loaded only once; otherwise the form builds its own on first use.
+        """
+        self.label_converter = converter
         super().__init__(*args, **kwargs)
+        # Annotate custom label presence per axis so the selected FloorPlan carries it without extra queries, and
+        # join its Location, which FloorPlanTile.clean() compares against the Rack's
+        custom_labels = models.FloorPlanCustomAxisLabel.objects.filter(floor_plan=OuterRef("pk"))
+        floor_plans = self.fields["floor_plan"].queryset.select_related("location")
+        self.fields["floor_plan"].queryset = floor_plans.annotate(
+            has_x_custom_labels=Exists(custom_labels.filter(axis="X")),
+            has_y_custom_labels=Exists(custom_labels.filter(axis="Y")),
+        )
         self.x_letters = False
         self.y_letters = False
 
-        if fp_id := self.initial.get("floor_plan") or self.data.get("floor_plan"):
-            fp_obj = self.fields["floor_plan"].queryset.get(id=fp_id)
-            self.x_letters = fp_obj.x_axis_labels == choices.AxisLabelsChoices.LETTERS
-            self.y_letters = fp_obj.y_axis_labels == choices.AxisLabelsChoices.LETTERS
-            if not fp_obj.is_tile_movable:
-                self.fields["x_origin"].disabled = True
-                self.fields["y_origin"].disabled = True
-
-            if self.instance.x_origin or self.instance.y_origin:
-                if fp_obj.custom_labels.filter(axis="X").exists():
-                    converter = PositionToLabelConverter(self.instance.x_origin, "X", fp_obj)
-                    if label := converter.convert():
-                        self.initial["x_origin"] = label
-                else:
-                    self.initial["x_origin"] = general.axis_init_label_conversion(
-                        fp_obj.x_origin_seed,
-                        general.grid_number_to_letter(self.instance.x_origin)
-                        if self.x_letters
-                        else self.initial.get("x_origin"),
-                        fp_obj.x_axis_step,
-                        self.x_letters,
-                    )
-                if fp_obj.custom_labels.filter(axis="Y").exists():
-                    converter = PositionToLabelConverter(self.instance.y_origin, "Y", fp_obj)
-                    if label := converter.convert():
-                        self.initial["y_origin"] = label
-                else:
-                    self.initial["y_origin"] = general.axis_init_label_conversion(
-                        fp_obj.y_origin_seed,
-                        general.grid_number_to_letter(self.instance.y_origin)
-                        if self.y_letters
-                        else self.initial.get("y_origin"),
-                        fp_obj.y_axis_step,
-                        self.y_letters,
-                    )
+        # Resolved once here and reused by _clean_origin()
+        self._fp_obj = None
+        fp_id = self.initial.get("floor_plan") or self.data.get("floor_plan")
+        if not fp_id:
+            return
+
+        fp_obj = self._fp_obj = self._get_floor_plan(fp_id)
+        self.x_letters = fp_obj.x_axis_labels == LETTERS_AXIS_LABELS
+        self.y_letters = fp_obj.y_axis_labels == LETTERS_AXIS_LABELS
+        if not fp_obj.is_tile_movable:
+            self.fields["x_origin"].disabled = True
+            self.fields["y_origin"].disabled = True
+
+        # Initial origins are only rendered on unbound forms, but disabled fields take their value from initial
+        if not (self.instance.x_origin or self.instance.y_origin) or (self.is_bound and fp_obj.is_tile_movable):
+            return
+
+        for axis, using_letters in (("X", self.x_letters), ("Y", self.y_letters)):
+            axis_fields = AXIS_FIELDS[axis]
+            origin = getattr(self.instance, axis_fields.origin)
+            if not origin:
+                continue
+            if getattr(fp_obj, axis_fields.has_custom_labels):
+                custom_ranges = self._get_label_converter(fp_obj).custom_ranges[axis]
+                if label := PositionToLabelConverter(origin, axis, fp_obj, custom_ranges).convert():
+                    self.initial[axis_fields.origin] = label
+            else:
+                self.initial[axis_fields.origin] = axis_init_label_conversion(
+                    getattr(fp_obj, axis_fields.origin_seed),
+                    grid_number_to_letter(origin) if using_letters else self.initial.get(axis_fields.origin),
+                    getattr(fp_obj, axis_fields.axis_step),
+                    using_letters,
+                )
 
     def letter_validator(self, field, value, axis):
         """Validate that origin uses combination of letters."""
-        if not str(value).isupper():
+        label = value if isinstance(value, str) else str(value)
+        # Equivalent to matching [A-Z]+, without going through the regex engine
+        if not (label.isascii() and label.isalpha() and label.isupper()):
             self.add_error(field, f"{axis} origin should use capital letters.")
             return False
         return True
 
     def number_validator(self, field, value, axis):
         """Validate that origin uses combination of positive or negative numbers."""
-        if not str(value).replace("-", "").isnumeric():
+        if not _is_integer_label(value if isinstance(value, str) else str(value)):
             self.add_error(field, f"{axis} origin should use numbers.")
             return False
         return True
@@ -479,15 +603,15 @@ class FloorPlanTileForm(NautobotModelForm):
     def _clean_origin(self, field_name, axis):
         """Common clean method for origin fields."""
         # Retrieve floor plan object if available
-        fp_id = self.initial.get("floor_plan") or self.data.get("floor_plan")
-        if not fp_id:
+        fp_obj = self._fp_obj
+        if fp_obj is None:
             return 0
 
-        fp_obj = self.fields["floor_plan"].queryset.get(id=fp_id)
         value = self.cleaned_data.get(field_name)
 
         # Determine if letters are being used for x or y axis labels
-        using_letters = (field_name == "x_origin" and self.x_letters) or (field_name == "y_origin" and self.y_letters)
+        axis_fields = AXIS_FIELDS[axis]
+        using_letters = getattr(self, axis_fields.letters)
 
         # Perform validation based on the type (letters or numbers)
         validator = self.letter_validator if using_letters else self.number_validator
@@ -495,11 +619,9 @@ class FloorPlanTileForm(NautobotModelForm):
             return 0  # Required to pass model clean() method
 
         # Select the appropriate axis seed and step
-        if field_name == "x_origin":
-            origin_seed, step, use_letters = fp_obj.x_origin_seed, fp_obj.x_axis_step, self.x_letters
-        else:
-            origin_seed, step, use_letters = fp_obj.y_origin_seed, fp_obj.y_axis_step, self.y_letters
+        origin_seed = getattr(fp_obj, axis_fields.origin_seed)
+        step = getattr(fp_obj, axis_fields.axis_step)
 
         # Convert and return the label position using the specified conversion function
-        cleaned_value = general.axis_clean_label_conversion(origin_seed, value, step, use_letters)
+        cleaned_value = axis_clean_label_conversion(origin_seed, value, step, using_letters)
         return int(cleaned_value) if not using_letters else cleaned_value
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:57
+
+from django.db import migrations, models
+
+
+def _fix_zero_step_custom_labels(apps, _schema):
+    """Reset legacy zero steps to the default step of 1 so the step constraint can be added."""
+    model = apps.get_model("nautobot_floor_plan", "FloorPlanCustomAxisLabel")
+    model.objects.filter(step=0).update(step=1)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_floor_plan", "0009_add_custom_label_support"),
+    ]
+
+    operations = [
+        migrations.RunPython(_fix_zero_step_custom_labels, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="floorplancustomaxislabel",
+            constraint=models.CheckConstraint(
+                check=models.Q(("step", 0), _negated=True),
+                name="nautobot_floor_plan_floorplancustomaxislabel_step_not_zero",
+            ),
+        ),
+    ]
@@ -17,7 +17,7 @@ from nautobot_floor_plan.svg import FloorPlanSVG
 from nautobot_floor_plan.templatetags.seed_helpers import (
     render_axis_origin,
 )
-from nautobot_floor_plan.utils.custom_validators import ValidateNotZero
+from nautobot_floor_plan.utils.custom_validators import RangeValidator, ValidateNotZero
 from nautobot_floor_plan.utils.label_generator import FloorPlanLabelGenerator
 
 logger = logging.getLogger(__name__)
@@ -261,6 +261,12 @@ class FloorPlanCustomAxisLabel(models.Model):
         """Meta attributes."""
 
         ordering = ["floor_plan", "axis", "order"]
+        constraints = [
+            models.CheckConstraint(
+                check=~models.Q(step=0),
+                name="nautobot_floor_plan_floorplancustomaxislabel_step_not_zero",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         """Override save to reset seed values when custom labels are added."""
@@ -277,6 +283,42 @@ class FloorPlanCustomAxisLabel(models.Model):
                 self.floor_plan.x_origin_seed = 1
             elif self.axis == "Y" and self.floor_plan.y_origin_seed != 1:
                 self.floor_plan.y_origin_seed = 1
+        self.validate_no_overlapping_ranges()
+
+    def as_range(self):
+        """Return this label range in the dictionary format used by RangeValidator."""
+        return {
+            "start": self.start_label,
+            "end": self.end_label,
+            "step": self.step,
+            "increment_letter": self.increment_letter,
+            "label_type": self.label_type,
+        }
+
+    def validate_no_overlapping_ranges(self):
+        """Prevent this range from overlapping another custom label range on the same axis.
+
+        FloorPlanForm validates submitted ranges itself and stores them with bulk_create(), which skips clean(), so
+        this only guards labels saved one at a time with full_clean(), e.g. from scripts or the shell.
+        """
+        if not self.floor_plan_id:
+            return
+        validator = RangeValidator(max_size=None)
+        current_range = self.as_range()
+        for other in self.floor_plan.custom_labels.filter(axis=self.axis).exclude(pk=self.pk):
+            try:
+                overlaps = validator.check_range_overlap(current_range, other.as_range())
+            except ValueError as e:
+                # Malformed labels, e.g. an alphanumeric label whose number part isn't an integer
+                raise ValidationError(
+                    f"Unable to compare range from {self.start_label} to {self.end_label} with the existing "
+                    f"{self.axis} axis range from {other.start_label} to {other.end_label}: {e}"
+                ) from e
+            if overlaps:
+                raise ValidationError(
+                    f"Range from {self.start_label} to {self.end_label} overlaps with the existing "
+                    f"{self.axis} axis range from {other.start_label} to {other.end_label}."
+                )
 
 
 @extras_features(
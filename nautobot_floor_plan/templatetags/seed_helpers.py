@@ -38,9 +38,10 @@ def render_axis_origin(record, axis):
     axis_labels_choice = getattr(record.floor_plan, f"{axis.lower()}_axis_labels")
     origin_value = getattr(record, f"{axis.lower()}_origin")
 
-    # Check if custom labels exist for the axis
-    if record.floor_plan.custom_labels.filter(axis=axis).exists():
-        converter = label_converters.PositionToLabelConverter(origin_value, axis, record.floor_plan)
+    # Check if custom labels exist for the axis, reusing the loaded ranges for the conversion
+    custom_ranges = label_converters.get_custom_ranges(record.floor_plan, axis)
+    if custom_ranges:
+        converter = label_converters.PositionToLabelConverter(origin_value, axis, record.floor_plan, custom_ranges)
         return converter.convert()
 
     is_letters = axis_labels_choice == choices.AxisLabelsChoices.LETTERS
@@ -2,7 +2,7 @@
 
 from nautobot.core.testing import TestCase
 
-from nautobot_floor_plan import choices, forms
+from nautobot_floor_plan import choices, forms, models
 from nautobot_floor_plan.tests import fixtures
 from nautobot_floor_plan.utils import general, label_converters
 
@@ -69,11 +69,25 @@ class TestLabelConverters(TestCase):
             ("V", 5),
             ("X", 10),
             ("L", 50),
+            ("XIV", 14),
+            ("MCMXCIV", 1994),
         ]
         for label, number in test_cases:
             self.assertEqual(converter.to_numeric(label), number)
             self.assertEqual(converter.from_numeric(number), label)
 
+        # Test invalid input
+        with self.assertRaises(ValueError):
+            converter.to_numeric("XIZ")
+
+    def test_converter_factory_shares_stateless_converters(self):
+        """Test that only converters without per-label state are shared by the factory."""
+        factory = label_converters.LabelConverterFactory
+        for label_type in (choices.CustomAxisLabelsChoices.ROMAN, choices.CustomAxisLabelsChoices.HEX):
+            self.assertIs(factory.get_converter(label_type), factory.get_converter(label_type))
+        for label_type in (choices.CustomAxisLabelsChoices.NUMALPHA, choices.CustomAxisLabelsChoices.GREEK):
+            self.assertIsNot(factory.get_converter(label_type), factory.get_converter(label_type))
+
     def test_alphanumeric_converter(self):
         """Test alphanumeric label conversion."""
         converter = label_converters.AlphanumericConverter()
@@ -110,6 +124,12 @@ class TestLabelConverters(TestCase):
         with self.assertRaises(ValueError):
             converter.to_numeric("ABC")  # No number
 
+        # Test prefix validation
+        converter.set_prefix("AB")
+        for prefix in ("", "ab", "A1", "É"):
+            with self.subTest(prefix=prefix), self.assertRaises(ValueError):
+                converter.set_prefix(prefix)
+
 
 class TestPositionAndLabelConverters(TestCase):
     """Test position-to-label and label-to-position conversion."""
@@ -323,6 +343,7 @@ class TestPositionAndLabelConverters(TestCase):
 
     def _test_position_to_label_conversion(self, test_cases):
         """Helper method to test position to label conversion."""
+        prefetched_floor_plan = models.FloorPlan.objects.prefetch_related("custom_labels").get(pk=self.floor_plan.pk)
         for test in test_cases:
             with self.subTest(test=test):
                 converter = label_converters.PositionToLabelConverter(test["position"], "X", self.floor_plan)
@@ -332,9 +353,18 @@ class TestPositionAndLabelConverters(TestCase):
                     test["expected"],
                     f"Position {test['position']} converted to {label}, expected {test['expected']}",
                 )
+                # Prefetched custom labels are used without querying the database again
+                with self.assertNumQueries(0):
+                    converter = label_converters.PositionToLabelConverter(test["position"], "X", prefetched_floor_plan)
+                    self.assertEqual(converter.convert(), label)
 
     def _test_label_to_position_conversion(self, test_cases):
         """Helper method to test label to position conversion."""
+        with self.assertNumQueries(1):
+            batch_converter = label_converters.LabelToPositionConverter.build_batch(self.floor_plan)
+        prefetched_floor_plan = models.FloorPlan.objects.prefetch_related("custom_labels").get(pk=self.floor_plan.pk)
+        with self.assertNumQueries(0):
+            prefetched_batch_converter = label_converters.LabelToPositionConverter.build_batch(prefetched_floor_plan)
         for test in test_cases:
             with self.subTest(test=test):
                 converter = label_converters.LabelToPositionConverter(test["expected"], "X", self.floor_plan)
@@ -345,6 +375,8 @@ class TestPositionAndLabelConverters(TestCase):
                     f"Label {test['expected']} converted to position {position}, expected {test['position']}",
                 )
                 self.assertEqual(label, test["expected"])
+                self.assertEqual(batch_converter.convert(test["expected"], "X"), (position, label))
+                self.assertEqual(prefetched_batch_converter.convert(test["expected"], "X"), (position, label))
 
     def _test_out_of_range_values(self):
         """Helper method to test out of range values."""
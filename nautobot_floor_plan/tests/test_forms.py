@@ -2,11 +2,14 @@
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from nautobot.core.testing import TestCase
 from nautobot.extras.models import Tag
 
 from nautobot_floor_plan import choices, forms, models
 from nautobot_floor_plan.tests import fixtures
+from nautobot_floor_plan.utils.label_converters import LabelToPositionConverter
 
 
 class TestFloorPlanForm(TestCase):
@@ -241,6 +244,11 @@ class TestFloorPlanForm(TestCase):
                 "valid": False,
                 "error": "Invalid label type",
             },
+            {
+                "x_custom_ranges": '[{"start": "1", "end": "10", "step": 0, "label_type": "numbers"}]',
+                "valid": False,
+                "error": "Step value must be a non-zero integer.",
+            },
         ]
 
         for test_case in test_cases:
@@ -721,6 +729,9 @@ class TestFloorPlanTileForm(TestCase):
             x_axis_labels=choices.AxisLabelsChoices.LETTERS,
             y_axis_labels=choices.AxisLabelsChoices.NUMBERS,
         )
+        self.other_floor_plan = models.FloorPlan.objects.create(
+            location=data["floors"][1], x_size=8, y_size=8, tile_depth=100, tile_width=100
+        )
 
     def test_valid_minimal_inputs(self):
         """Test creation with minimal input data."""
@@ -758,6 +769,21 @@ class TestFloorPlanTileForm(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn("X origin should use capital letters.", form.errors.get("x_origin"))
 
+    def test_invalid_input_with_letters_and_numbers(self):
+        """Test creation with a mixed label when X axis uses letter labels."""
+        form = forms.FloorPlanTileForm(
+            data={
+                "floor_plan": self.floor_plan.pk,
+                "x_origin": "A1",
+                "y_origin": 1,
+                "x_size": 1,
+                "y_size": 1,
+                "status": self.status.pk,
+            }
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("X origin should use capital letters.", form.errors.get("x_origin"))
+
     def test_invalid_input_with_letter(self):
         """Test creation with letter when Y axis uses number labels."""
         form = forms.FloorPlanTileForm(
@@ -787,3 +813,69 @@ class TestFloorPlanTileForm(TestCase):
         )
         self.assertFalse(form.is_valid())
         self.assertIn(['Too large for Floor Plan for Location "Floor 1"'], form.errors.values())
+
+    def test_invalid_input_with_embedded_dash(self):
+        """Test creation with a malformed negative number when Y axis uses number labels."""
+        form = forms.FloorPlanTileForm(
+            data={
+                "floor_plan": self.floor_plan.pk,
+                "x_origin": "A",
+                "y_origin": "1-2",
+                "x_size": 1,
+                "y_size": 1,
+                "status": self.status.pk,
+            }
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("Y origin should use numbers.", form.errors.get("y_origin"))
+
+    def test_shared_label_converter(self):
+        """Tile forms sharing a converter load the floor plan's custom labels once, unless it's for another floor plan."""
+        for floor_plan in (self.floor_plan, self.other_floor_plan):
+            models.FloorPlanCustomAxisLabel.objects.create(
+                floor_plan=floor_plan, axis="X", label_type="roman", start_label="I", end_label="VIII"
+            )
+
+        def custom_label_queries(context):
+            return [
+                query
+                for query in context.captured_queries
+                if query["sql"].startswith('SELECT "nautobot_floor_plan_floorplancustomaxislabel"')
+            ]
+
+        with CaptureQueriesContext(connection) as context:
+            converter = LabelToPositionConverter.build_batch(self.floor_plan)
+            for x_origin, position in (("III", 3), ("VII", 7)):
+                form = forms.FloorPlanTileForm(
+                    data={
+                        "floor_plan": self.floor_plan.pk,
+                        "x_origin": x_origin,
+                        "y_origin": 1,
+                        "x_size": 1,
+                        "y_size": 1,
+                        "status": self.status.pk,
+                    },
+                    converter=converter,
+                )
+                self.assertTrue(form.is_valid(), form.errors)
+                self.assertEqual(form.cleaned_data["x_origin"], position)
+                self.assertIs(form.label_converter, converter)
+        self.assertEqual(len(custom_label_queries(context)), 1)
+
+        # A converter for another floor plan is replaced by one for the selected floor plan
+        with CaptureQueriesContext(connection) as context:
+            form = forms.FloorPlanTileForm(
+                data={
+                    "floor_plan": self.other_floor_plan.pk,
+                    "x_origin": "II",
+                    "y_origin": 1,
+                    "x_size": 1,
+                    "y_size": 1,
+                    "status": self.status.pk,
+                },
+                converter=converter,
+            )
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data["x_origin"], 2)
+        self.assertEqual(form.label_converter.fp_obj.pk, self.other_floor_plan.pk)
+        self.assertEqual(len(custom_label_queries(context)), 1)
@@ -1,6 +1,11 @@
 """Test FloorPlan."""
 
+import importlib
+from unittest import skipUnless
+
+from django.apps import apps
 from django.core.exceptions import ValidationError
+from django.db import connection
 from nautobot.core.testing import TestCase
 from nautobot.dcim.models import Rack, RackGroup
 
@@ -417,3 +422,69 @@ class TestFloorPlanTile(TestCase):
             models.FloorPlanTile(
                 floor_plan=self.floor_plans[0], status=self.active_status, x_origin=1, y_origin=1, rack=non_located_rack
             ).validated_save()
+
+
+class TestFloorPlanCustomAxisLabel(TestCase):
+    """Test FloorPlanCustomAxisLabel model."""
+
+    def setUp(self):
+        """Create LocationType, Status, Location and FloorPlan records."""
+        data = fixtures.create_prerequisites()
+        self.floor_plan = models.FloorPlan.objects.create(location=data["floors"][0], x_size=10, y_size=10)
+        models.FloorPlanCustomAxisLabel.objects.create(
+            floor_plan=self.floor_plan, axis="X", label_type="numbers", start_label="1", end_label="5", order=0
+        )
+
+    def test_create_custom_label_valid(self):
+        """A range that does not overlap an existing range on the same axis is valid."""
+        models.FloorPlanCustomAxisLabel(
+            floor_plan=self.floor_plan, axis="X", label_type="numbers", start_label="6", end_label="10", order=1
+        ).full_clean()
+        models.FloorPlanCustomAxisLabel(
+            floor_plan=self.floor_plan, axis="Y", label_type="numbers", start_label="1", end_label="5", order=0
+        ).full_clean()
+
+    def test_create_custom_label_invalid_overlap(self):
+        """A range can't overlap an existing range on the same axis."""
+        with self.assertRaises(ValidationError):
+            models.FloorPlanCustomAxisLabel(
+                floor_plan=self.floor_plan, axis="X", label_type="numbers", start_label="3", end_label="7", order=1
+            ).full_clean()
+
+    def test_create_custom_label_invalid_malformed_existing_range(self):
+        """Comparing against a malformed stored range raises a ValidationError rather than a ValueError."""
+        models.FloorPlanCustomAxisLabel.objects.create(
+            floor_plan=self.floor_plan, axis="Y", label_type="alphanumeric", start_label="A1x", end_label="A5", order=0
+        )
+        with self.assertRaises(ValidationError):
+            models.FloorPlanCustomAxisLabel(
+                floor_plan=self.floor_plan,
+                axis="Y",
+                label_type="alphanumeric",
+                start_label="A6",
+                end_label="A9",
+                order=1,
+            ).full_clean()
+
+    # Altering the table inside the test's transaction needs PostgreSQL's transactional DDL
+    @skipUnless(connection.vendor == "postgresql", "Requires transactional DDL")
+    def test_migration_fixes_zero_step(self):
+        """Legacy ranges with a zero step are reset to 1 before the step constraint is added."""
+        migration = importlib.import_module("nautobot_floor_plan.migrations.0010_add_custom_label_step_constraint")
+        model = models.FloorPlanCustomAxisLabel
+        (constraint,) = model._meta.constraints
+        with connection.cursor() as cursor:
+            # Flush the deferred foreign key checks queued by setUp(), which would otherwise block ALTER TABLE
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        with connection.schema_editor() as schema_editor:
+            schema_editor.remove_constraint(model, constraint)
+        legacy_label = model.objects.create(
+            floor_plan=self.floor_plan, axis="Y", label_type="numbers", start_label="1", end_label="5", step=0
+        )
+
+        migration._fix_zero_step_custom_labels(apps, None)  # pylint: disable=protected-access
+        with connection.schema_editor() as schema_editor:
+            schema_editor.add_constraint(model, constraint)
+
+        legacy_label.refresh_from_db()
+        self.assertEqual(legacy_label.step, 1)
@@ -14,7 +14,13 @@ from nautobot_floor_plan.utils.label_converters import LabelConverterFactory
 
 
 class RangeValidator:
-    """Helper class to validate custom ranges."""
+    """Helper class to validate custom ranges.
+
+    Build one validator per axis and reuse it for every range; per-range state is passed to each method.
+    """
+
+    REQUIRED_KEYS = frozenset(("start", "end", "label_type"))
+    LABEL_TYPES = frozenset(choices.CustomAxisLabelsChoices.values())
 
     def __init__(self, max_size):
         """Initialize validator with max size."""
@@ -23,13 +29,17 @@ class RangeValidator:
 
     def validate_required_keys(self, label_range):
         """Validate that all required keys are present in the range."""
-        required_keys = {"start", "end", "label_type"}
-        if not all(k in label_range for k in required_keys):
-            raise forms.ValidationError(f"Range is missing required keys {required_keys}.")
+        if not self.REQUIRED_KEYS.issubset(label_range):
+            raise forms.ValidationError(f"Range is missing required keys {set(self.REQUIRED_KEYS)}.")
+
+    def validate_step(self, label_range):
+        """Validate the step is not zero, which the database rejects for stored ranges."""
+        if label_range.get("step", 1) == 0:
+            raise forms.ValidationError("Step value must be a non-zero integer.")
 
     def validate_label_type(self, label_type):
         """Validate the label type is valid."""
-        if label_type not in dict(choices.CustomAxisLabelsChoices.CHOICES):
+        if label_type not in self.LABEL_TYPES:
             raise forms.ValidationError(
                 f"Invalid label type '{label_type}' ."
                 f"Valid types are: {', '.join(choices.CustomAxisLabelsChoices.values())}"
@@ -1,27 +1,35 @@
 """Utilities module."""
 
+import string
+
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+# Lookup tables for the single-letter grid labels, by far the most common case
+GRID_LETTERS = string.ascii_uppercase
+GRID_NUMBERS = {letter: number for number, letter in enumerate(GRID_LETTERS, start=1)}
+
 
 def grid_number_to_letter(number):
     """Returns letter for number [1 - 26] --> [A - Z], [27 - 52] --> [AA - AZ]."""
-    col_str = ""
-    while number:
-        remainder = number % 26
-        if remainder == 0:
-            remainder = 26
-        col_letter = chr(ord("A") + remainder - 1)
-        col_str = col_letter + col_str
-        number = int((number - 1) / 26)
-    return col_str
+    if 0 < number <= 26:
+        return GRID_LETTERS[number - 1]
+    letters = []
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters.append(GRID_LETTERS[remainder])
+    return "".join(reversed(letters))
 
 
 def grid_letter_to_number(letter):
     """Returns number for letter [A - Z] --> [1 - 26], [AA - AZ] --> [27 - 52]."""
-    number = ord(letter[-1]) - 64
-    if letter[:-1]:
-        return 26 * (grid_letter_to_number(letter[:-1])) + number
+    try:
+        return GRID_NUMBERS[letter]
+    except KeyError:
+        pass
+    number = 0
+    for char in letter:
+        number = number * 26 + ord(char) - 64
     return number
 
 
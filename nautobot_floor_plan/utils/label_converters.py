@@ -2,6 +2,7 @@
 
 import logging
 import re
+from typing import NamedTuple
 
 from nautobot_floor_plan.choices import CustomAxisLabelsChoices
 from nautobot_floor_plan.utils.general import (
@@ -14,31 +15,71 @@ from nautobot_floor_plan.utils.general import (
 logger = logging.getLogger(__name__)
 
 
+class RangeBounds(NamedTuple):
+    """A custom range's converter and the numeric values of its start and end labels."""
+
+    converter: object
+    start_value: int
+    end_value: int
+
+    @property
+    def size(self):
+        """Number of positions covered by the range, whichever direction it runs in."""
+        return abs(self.end_value - self.start_value) + 1
+
+
+def get_custom_ranges(fp_obj, axis=None):
+    """Return the custom label ranges of one floor plan axis, or of every axis if none is given, ordered by id.
+
+    Uses the floor plan's prefetched custom labels when available, e.g. from
+    `prefetch_related("floor_plan__custom_labels")` on a tile queryset, so that
+    rendering many tiles doesn't cost a query per tile.
+    """
+    prefetched = getattr(fp_obj, "_prefetched_objects_cache", {}).get("custom_labels")
+    if prefetched is not None:
+        return sorted(
+            (custom_range for custom_range in prefetched if axis is None or custom_range.axis == axis),
+            key=lambda r: r.id,
+        )
+    custom_ranges = fp_obj.custom_labels.all() if axis is None else fp_obj.custom_labels.filter(axis=axis)
+    return list(custom_ranges.order_by("id"))
+
+
 class BaseLabelConverter:
     """Base class for converting position to labels and back."""
 
-    def __init__(self, axis, fp_obj):
+    def __init__(self, axis, fp_obj, custom_ranges=None):
         """Initializing base Label variables."""
         self.axis = axis
         self.fp_obj = fp_obj
+        self.custom_ranges = custom_ranges
         self.current_position = 1
 
     def _get_custom_ranges(self):
-        """Retrieve and order custom ranges for the axis."""
-        return self.fp_obj.custom_labels.filter(axis=self.axis).order_by("id")
+        """Retrieve and order custom ranges for the axis, loading them at most once per converter."""
+        if self.custom_ranges is None:
+            self.custom_ranges = get_custom_ranges(self.fp_obj, self.axis)
+        return self.custom_ranges
 
     def _get_label_converter(self, label_type):
         """Retrieve the proper converter for label type."""
         return LabelConverterFactory.get_converter(label_type)
 
-    def _calculate_range_size(self, custom_range):
-        """Calculate the range size for the given custom range."""
+    def _get_range_bounds(self, custom_range, increment_prefix):
+        """Return a converter for the range along with the numeric values of its start and end labels."""
         converter = self._get_label_converter(custom_range.label_type)
-        if custom_range.label_type == CustomAxisLabelsChoices.ALPHANUMERIC:
-            converter.set_increment_prefix(custom_range.increment_letter)
+        converter.set_increment_prefix(increment_prefix)
         start_value = converter.to_numeric(custom_range.start_label)
         end_value = converter.to_numeric(custom_range.end_label)
-        return abs(end_value - start_value) + 1
+        return RangeBounds(converter, start_value, end_value)
+
+    def _get_sizing_increment_prefix(self, custom_range):
+        """Return the increment mode used to size a range; only alphanumeric ranges size by their own mode."""
+        return custom_range.label_type == CustomAxisLabelsChoices.ALPHANUMERIC and bool(custom_range.increment_letter)
+
+    def _calculate_range_size(self, custom_range):
+        """Calculate the range size for the given custom range."""
+        return self._get_range_bounds(custom_range, self._get_sizing_increment_prefix(custom_range)).size
 
     def _is_descending_range(self, start_value, end_value):
         """Check if the range is descending."""
@@ -70,12 +111,8 @@ class BaseLabelConverter:
 
     def _convert_numeric_values(self, custom_range, value):
         """Convert value and range bounds to numeric values."""
-        converter = self._get_label_converter(custom_range.label_type)
-        converter.set_increment_prefix(custom_range.increment_letter)
-
+        converter, start_value, end_value = self._get_range_bounds(custom_range, custom_range.increment_letter)
         numeric_value = converter.to_numeric(value)
-        start_value = converter.to_numeric(custom_range.start_label)
-        end_value = converter.to_numeric(custom_range.end_label)
 
         return converter, numeric_value, start_value, end_value
 
@@ -94,18 +131,23 @@ class BaseLabelConverter:
 class PositionToLabelConverter(BaseLabelConverter):
     """Class to modify the position to proper custom label in forms."""
 
-    def __init__(self, position, axis, fp_obj):
+    def __init__(self, position, axis, fp_obj, custom_ranges=None):
         """Initialize Position to Label Converter variables."""
-        super().__init__(axis, fp_obj)
+        super().__init__(axis, fp_obj, custom_ranges)
         self.position = position
 
     def convert(self):
         """Main method to convert a position to its display label."""
         for custom_range in self._get_custom_ranges():
-            range_size = self._calculate_range_size(custom_range)
+            increment_prefix = self._get_sizing_increment_prefix(custom_range)
+            bounds = self._get_range_bounds(custom_range, increment_prefix)
+            range_size = bounds.size
 
             if self._position_in_range(range_size):
-                return self._calculate_label(custom_range)
+                # The sizing bounds can be reused unless the label needs the converter in another increment mode
+                if increment_prefix != bool(custom_range.increment_letter):
+                    bounds = self._get_range_bounds(custom_range, custom_range.increment_letter)
+                return self._calculate_label(custom_range, bounds)
 
             self._adjust_position(range_size)
 
@@ -125,14 +167,10 @@ class PositionToLabelConverter(BaseLabelConverter):
         numeric_value = start_value + (relative_position - 1)
         return min(numeric_value, end_value)
 
-    def _calculate_label(self, custom_range):
-        """Generate the display label for the position."""
+    def _calculate_label(self, custom_range, bounds):
+        """Generate the display label for the position from the range's converter and numeric bounds."""
         relative_position = self.position - self.current_position + 1
-        converter = self._get_label_converter(custom_range.label_type)
-        converter.set_increment_prefix(custom_range.increment_letter)
-
-        start_value = converter.to_numeric(custom_range.start_label)
-        end_value = converter.to_numeric(custom_range.end_label)
+        converter, start_value, end_value = bounds
 
         if not custom_range.increment_letter:
             numeric_value = self._calculate_relative_numeric_value(start_value, end_value, relative_position)
@@ -149,20 +187,22 @@ class PositionToLabelConverter(BaseLabelConverter):
 class LabelToPositionConverter(BaseLabelConverter):
     """Convert a label to its absolute position based on custom ranges."""
 
-    def __init__(self, label, axis, fp_obj):
+    def __init__(self, label, axis, fp_obj, custom_ranges=None):
         """Initialize the label-to-position converter."""
-        super().__init__(axis, fp_obj)
+        super().__init__(axis, fp_obj, custom_ranges)
         self.label = label
 
+    @classmethod
+    def build_batch(cls, fp_obj):
+        """Return a reusable converter that loads the floor plan's custom ranges only once."""
+        return BatchLabelToPositionConverter(fp_obj)
+
     def convert(self):
         """Main method to convert a label to its absolute position."""
         for custom_range in self._get_custom_ranges():
             try:
-                converter = self._get_label_converter(custom_range.label_type)
-                converter.set_increment_prefix(custom_range.increment_letter)
-
                 if self._label_in_range(custom_range):
-                    absolute_position = self._calculate_position(custom_range, converter)
+                    absolute_position = self._calculate_position(custom_range)
                     return absolute_position, self.label
 
                 self._adjust_position(self._calculate_range_size(custom_range))
@@ -181,14 +221,12 @@ class LabelToPositionConverter(BaseLabelConverter):
             return self._label_in_letter_range(custom_range)
         return self._label_in_numeric_range(custom_range)
 
-    def _calculate_position(self, custom_range, converter):
+    def _calculate_position(self, custom_range):
         """Calculate absolute position for any label type."""
         if custom_range.label_type in [CustomAxisLabelsChoices.ALPHANUMERIC, CustomAxisLabelsChoices.NUMBERS]:
             return self._calculate_alphanumeric_position(custom_range)
 
-        numeric_value = converter.to_numeric(self.label)
-        start_value = converter.to_numeric(custom_range.start_label)
-        end_value = converter.to_numeric(custom_range.end_label)
+        _, numeric_value, start_value, end_value = self._convert_numeric_values(custom_range, self.label)
 
         return self._calculate_position_from_values(numeric_value, start_value, end_value)
 
@@ -301,6 +339,21 @@ class LabelToPositionConverter(BaseLabelConverter):
             return None
 
 
+class BatchLabelToPositionConverter:
+    """Convert many labels of a single floor plan to positions, sharing one load of its custom ranges."""
+
+    def __init__(self, fp_obj):
+        """Preload the custom ranges of every axis of the floor plan."""
+        self.fp_obj = fp_obj
+        self.custom_ranges = {"X": [], "Y": []}
+        for custom_range in get_custom_ranges(fp_obj):
+            self.custom_ranges[custom_range.axis].append(custom_range)
+
+    def convert(self, label, axis):
+        """Convert a label on the given axis to its absolute position."""
+        return LabelToPositionConverter(label, axis, self.fp_obj, self.custom_ranges[axis]).convert()
+
+
 class LabelConverter:
     """Base class for label conversion."""
 
@@ -417,28 +470,15 @@ class RomanConverter(LabelConverter):
         ("I", 1),
     ]
 
+    # Numeral tokens and their values, matched two-character tokens first
+    ROMAN_TOKEN_VALUES = dict(ROMAN_VALUES)
+    ROMAN_TOKEN_RE = re.compile("CM|CD|XC|XL|IX|IV|M|D|C|L|X|V|I")
+
     def __init__(self):
         """Initialize the converter."""
         super().__init__()
         self._current_value = None
 
-    def _convert_next_numeral(self, label, index):
-        """Convert next Roman numeral and return its value and new index."""
-        # Try two character combinations first
-        if index + 1 < len(label):
-            double_char = label[index : index + 2]
-            for roman, value in self.ROMAN_VALUES:
-                if double_char == roman:
-                    return value, index + 2
-
-        # Try single character
-        single_char = label[index]
-        for roman, value in self.ROMAN_VALUES:
-            if single_char == roman:
-                return value, index + 1
-
-        raise ValueError(f"Invalid Roman numeral character at position {index} in: {label}")
-
     def to_numeric(self, label):
         """Convert Roman numeral to integer."""
         if not label:
@@ -448,9 +488,15 @@ class RomanConverter(LabelConverter):
         index = 0
         label = label.upper()
 
-        while index < len(label):
-            value, index = self._convert_next_numeral(label, index)
-            result += value
+        for match in self.ROMAN_TOKEN_RE.finditer(label):
+            # finditer skips characters that aren't numerals, which shows up as a gap before the next token
+            if match.start() != index:
+                break
+            result += self.ROMAN_TOKEN_VALUES[match.group()]
+            index = match.end()
+
+        if index != len(label):
+            raise ValueError(f"Invalid Roman numeral character at position {index} in: {label}")
 
         self._current_value = result
         return result
@@ -464,9 +510,9 @@ class RomanConverter(LabelConverter):
         remaining = number
 
         for roman, value in self.ROMAN_VALUES:
-            while remaining >= value:
-                result.append(roman)
-                remaining -= value
+            count, remaining = divmod(remaining, value)
+            if count:
+                result.append(roman * count)
 
         roman_numeral = "".join(result)
         return f"{prefix}{roman_numeral}" if prefix else roman_numeral
@@ -484,6 +530,7 @@ class GreekConverter(LabelConverter):
 
     GREEK_LETTERS = "αβγδεζηθικλμνξοπρστυφχψω"
     GREEK_LETTER_MAP = {letter: i + 1 for i, letter in enumerate(GREEK_LETTERS)}
+    GREEK_SPLIT_RE = re.compile(r"(\D*)(.*)", re.DOTALL)
 
     def __init__(self):
         """Initialize the converter."""
@@ -496,16 +543,9 @@ class GreekConverter(LabelConverter):
         if not label:
             raise ValueError("Greek letter cannot be empty")
 
-        # Handle prefixed numbers (like α1, β2)
-        prefix = ""
-        greek_part = label.lower()
-
-        # Split numeric suffix if exists
-        for i, char in enumerate(label):
-            if char.isdigit():
-                prefix = label[i:]
-                greek_part = label[:i].lower()
-                break
+        # Handle prefixed numbers (like α1, β2) by splitting off everything from the first digit
+        greek_part, prefix = self.GREEK_SPLIT_RE.fullmatch(label).groups()
+        greek_part = greek_part.lower()
 
         try:
             base_value = self.GREEK_LETTER_MAP.get(greek_part)
@@ -641,7 +681,7 @@ class AlphanumericConverter(LabelConverter):
         self._number = number
 
         if self._increment_prefix:
-            return sum((ord(c) - ord("A") + 1) * (26**i) for i, c in enumerate(reversed(prefix)))
+            return grid_letter_to_number(prefix)
         return int(number)
 
     def from_numeric(self, number, prefix=""):
@@ -674,7 +714,8 @@ class AlphanumericConverter(LabelConverter):
 
     def set_prefix(self, prefix):
         """Set the prefix for the label converter."""
-        if not re.match(r"^[A-Z]+$", prefix):
+        # Equivalent to matching [A-Z]+, without going through the regex engine
+        if not (prefix and prefix.isascii() and prefix.isalpha() and prefix.isupper()):
             raise ValueError("Prefix must be a non-empty string of uppercase letters")
         self._prefix = prefix
 
@@ -693,6 +734,13 @@ class LabelConverterFactory:
         CustomAxisLabelsChoices.NUMBERS: AlphanumericConverter,
     }
 
+    # Converters that keep no state between calls can be shared instead of instantiated on every lookup;
+    # the others remember prefixes and formats from to_numeric() for from_numeric() and need a fresh instance.
+    _stateless_label_types = frozenset(
+        (CustomAxisLabelsChoices.ROMAN, CustomAxisLabelsChoices.BINARY, CustomAxisLabelsChoices.HEX)
+    )
+    _shared_converters = {}
+
     @classmethod
     def get_converter(cls, label_type):
         """Get the appropriate converter for the label type."""
@@ -701,4 +749,9 @@ class LabelConverterFactory:
             raise ValueError(
                 f"Unsupported label type: {label_type}. " f"Supported types are: {', '.join(cls._converters.keys())}"
             )
+        if label_type in cls._stateless_label_types:
+            converter = cls._shared_converters.get(label_type)
+            if converter is None:
+                converter = cls._shared_converters[label_type] = converter_class()
+            return converter
         return converter_class()
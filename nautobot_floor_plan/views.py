@@ -1,5 +1,6 @@
 """Views for FloorPlan."""
 
+from django.db.models import Exists, OuterRef
 from django_tables2 import RequestConfig
 from nautobot.apps.views import (
     NautobotUIViewSet,
@@ -30,6 +31,15 @@ class FloorPlanUIViewSet(NautobotUIViewSet):  # TODO we only need a subset of vi
     serializer_class = serializers.FloorPlanSerializer
     table_class = tables.FloorPlanTable
 
+    def get_queryset(self):
+        """Annotate custom label presence when editing so FloorPlanForm can skip loading ranges that don't exist."""
+        queryset = super().get_queryset()
+        if self.action == "update":
+            queryset = queryset.annotate(
+                has_custom_labels=Exists(models.FloorPlanCustomAxisLabel.objects.filter(floor_plan=OuterRef("pk")))
+            )
+        return queryset
+
 
 class LocationFloorPlanTab(ObjectView):
     """Add a "Floor Plan" tab to the Location detail view."""
@@ -86,3 +96,10 @@ class FloorPlanTileUIViewSet(
     serializer_class = serializers.FloorPlanTileSerializer
     table_class = tables.FloorPlanTileTable
     action_buttons = ()
+
+    def get_queryset(self):
+        """Load each listed tile's floor plan, its Location and custom labels up front, as every row renders them."""
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.select_related("floor_plan__location").prefetch_related("floor_plan__custom_labels")
+        return queryset